@@ -3,19 +3,29 @@
 import os
 import shutil
 import re
+import stat
 import sys
-from tkinter import Tk, Label
-from PIL import Image, ImageTk, ImageDraw
-from collections import deque
-
-try:
-    import vlc
-except ImportError:
-    vlc = None
+from collections import OrderedDict
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from functools import partial
+from itertools import islice
+# tkinter, Pillow та python-vlc імпортуються там, де вони вперше потрібні: так --help
+# і помилки в аргументах не чекають на завантаження GUI, графічних модулів і libvlc.
 
 IMAGE_EXTENSIONS = ('.png', '.jpg', '.jpeg', '.gif', '.bmp', '.tiff', '.webp')
 VIDEO_EXTENSIONS = ('.mp4', '.mov', '.avi', '.mkv', '.m4v', '.wmv', '.mpg', '.mpeg', '.flv', '.webm', '.3gp')
+# Множини для швидкої перевірки розширення під час пошуку файлів
+IMAGE_EXT_SET = frozenset(IMAGE_EXTENSIONS)
+VIDEO_EXT_SET = frozenset(VIDEO_EXTENSIONS)
+# Допустимі значення --filetypes
+FILETYPE_CHOICES = frozenset(("photo", "video", "all"))
 VIDEO_SCRUB_STEP_MS = 5000
+RESIZE_DEBOUNCE_MS = 150
+PREFETCH_AHEAD = 2
+COPY_POLL_MS = 200
+IMAGE_CACHE_SIZE = 8
+IMAGE_CACHE_BUCKET_PX = 32
+DIAGNOSTIC_LISTING_LIMIT = 20
 
 
 def _normalize_sort_mode(value):
@@ -25,6 +35,38 @@ def _normalize_sort_mode(value):
 
 NATURAL_CHUNK_RE = re.compile(r"(\d+)")
 
+
+def _natural_key(text):
+    """
+    Формує натуральний ключ сортування для тексту.
+    Після split із групою числа завжди стоять на непарних позиціях,
+    тож isdigit для кожного шматка не потрібен.
+    """
+    chunks = NATURAL_CHUNK_RE.split(text.lower())
+    chunks[1::2] = map(int, chunks[1::2])
+    return tuple(chunks)
+
+
+# Ключі сортування отримують запис (шлях, назва, stat, тип) з _get_all_media_files.
+def _name_sort_key(record):
+    return record[1].lower()
+
+
+def _natural_sort_key(record):
+    return _natural_key(record[1])
+
+
+def _stat_sort_key(attribute, record):
+    """
+    Безпечно отримує значення st_* із результату stat, зібраного під час
+    пошуку файлів, повертаючи 0, якщо stat отримати не вдалося.
+    """
+    stat_result = record[2]
+    if stat_result is None:
+        return 0
+    return getattr(stat_result, attribute, 0)
+
+
 # Спрощені варіанти сортування з короткими ключами
 SORT_MODE_VARIANTS = [
     ("name", "За назвою (А-Я)", {"type": "alpha", "reverse": False}),
@@ -53,7 +95,9 @@ class PhotoSorterApp:
     підтримує різні режими сортування та показує відео з аудіо
     (через VLC, якщо доступний).
     """
-    def __init__(self, master, source_dir, destination_dirs, transfer_mode="move", sort_mode="name", filetypes="all"):
+    def __init__(self, master, source_dir, destination_dirs, transfer_mode="move", sort_mode="name", filetypes="all", verbose=False, scan_workers=1):
+        from tkinter import Label, StringVar
+
         self.master = master
         self.master.title("Сортувальник Фотографій")
         # Встановлюємо початковий розмір вікна.
@@ -63,6 +107,7 @@ class PhotoSorterApp:
         self.master.bind("<Key>", self.on_key_press)
         # Додаємо обробник подій зміни розміру вікна для адаптації зображення.
         self.master.bind("<Configure>", self.on_resize)
+        self.master.protocol("WM_DELETE_WINDOW", self.close)
 
         # Перетворюємо шляхи на абсолютні для уникнення проблем
         self.source_dir = os.path.abspath(source_dir)
@@ -70,8 +115,17 @@ class PhotoSorterApp:
         self.sort_mode = sort_mode
         self.sort_mode_label = SORT_MODE_INFO[self.sort_mode]["label"]
         self.filetypes = filetypes
+        self.verbose = verbose
+        self.scan_workers = scan_workers
+        try:
+            import vlc
+        except ImportError:
+            vlc = None
+        self.vlc = vlc
         self.vlc_available = vlc is not None
-        self.vlc_instance = vlc.Instance("--quiet") if self.vlc_available else None
+        # Екземпляр VLC (завантаження плагінів) створюється з першим відео,
+        # тож сесії лише з фото за нього не платять.
+        self.vlc_instance = None
         self.vlc_player = None
         self.video_status_job = None
         self.current_media_type = None
@@ -80,6 +134,28 @@ class PhotoSorterApp:
         self.current_instruction_text = ""
         self.video_duration_ms = 0
         self.video_paused = False
+        self._video_status_seconds = None # (поточна, загальна) секунда в статус-рядку
+        self._resize_after_id = None
+        self._live_render_job = None
+        self._last_window_size = None
+        self._broken = [] # Файли, які не вдалося показати
+        # Фоновий пул декодує наступні фото, поки користувач дивиться поточне.
+        # Індекс -> (розмір області перегляду, Future з готовим PIL.Image).
+        self._pool = ThreadPoolExecutor(max_workers=2)
+        self._prefetch = {}
+        # Останні показані кадри: (шлях, ширина//32, висота//32) -> ImageTk.PhotoImage.
+        self._image_cache = OrderedDict()
+        # Останнє декодоване фото (шлях, PIL.Image): зміна розміру вікна
+        # перемальовує його без повторного відкриття файлу.
+        self._current_source = None
+        # Копіювання (режим copy) виконується в окремому однопотоковому пулі,
+        # щоб великі файли не блокували інтерфейс і не заважали попередньому
+        # декодуванню. Результати перевіряються з потоку Tk через after().
+        self._copy_pool = ThreadPoolExecutor(max_workers=1)
+        self._inflight_copies = []
+        self._copy_poll_job = None
+        # Теки призначення, які вже точно існують: makedirs для них не потрібен.
+        self._mkdir_cache = set()
 
         destination_dirs = [os.path.abspath(path) for path in destination_dirs]
         if len(destination_dirs) < 2:
@@ -93,16 +169,23 @@ class PhotoSorterApp:
             # Створення цільових директорій, якщо вони не існують.
             # exist_ok=True запобігає помилці, якщо тека вже є.
             os.makedirs(dest, exist_ok=True)
+            self._mkdir_cache.add(dest)
 
         self.key_to_destination = {key: dest for key, dest, _ in self.destination_options}
         self.destination_labels = {dest: label for _, dest, label in self.destination_options}
         self.destination_instruction_text = ", ".join(
             [f"'{key}' для {label}" for key, _, label in self.destination_options]
         )
-
-        # Збираємо всі файли з вихідної директорії та її підтек.
-        self.photo_files = self._get_all_media_files()
-        # Список впорядковується згідно з параметром sort_mode.
+        # Підказки не змінюються під час роботи, тож готуємо їх один раз.
+        self.instruction_texts = {
+            media_kind: self._build_instruction_text(media_kind) for media_kind in ("Фото", "Відео")
+        }
+
+        # Списки медіафайлів заповнює _load_media_files, коли вікно вже показане.
+        self.photo_files = []
+        self.photo_relpaths = []
+        self.photo_basenames = []
+        self.photo_kinds = []
         self.current_photo_index = -1 # Індекс поточного об'єкта, load_next_photo зробить його 0.
 
         # Створюємо мітку для відображення зображення.
@@ -111,84 +194,209 @@ class PhotoSorterApp:
         self.image_label.pack(expand=True, fill="both")
 
         # Створюємо мітку для відображення статусу та інструкцій.
-        self.status_label = Label(master, text="Завантаження...", font=("Arial", 12), wraplength=750)
+        # Текст статусу оновлюється через StringVar, а не через повний config() віджета.
+        self.status_var = StringVar(master, value=f"Пошук медіафайлів у {self.source_dir}...")
+        self.status_label = Label(master, textvariable=self.status_var, font=("Arial", 12), wraplength=750)
         self.status_label.pack(side="bottom", pady=10)
 
+        # Даємо час вікну з'явитися, а вже потім шукаємо файли: на великих
+        # теках пошук триває помітно, і без цього вікно не показувалося б зовсім.
+        self.master.after(100, self._load_media_files)
+
+    def _load_media_files(self):
+        """
+        Збирає медіафайли, показує діагностику та перше фото.
+        Викликається після першого показу вікна зі статусом пошуку.
+        """
+        self.master.update_idletasks()
+        # Збираємо всі файли з вихідної директорії та її підтек.
+        media_records = self._get_all_media_files()
+        # Список впорядковується згідно з параметром sort_mode.
+        # Паралельно до нього один раз готуємо імена файлів, відносні шляхи
+        # та тип медіа, щоб не розбирати шляхи заново на кожне натискання клавіші.
+        source_prefix_len = len(os.path.join(self.source_dir, ""))
+        self.photo_files = [path for path, _, _, _ in media_records]
+        self.photo_relpaths = [path[source_prefix_len:] for path in self.photo_files]
+        self.photo_basenames = [name for _, name, _, _ in media_records]
+        self.photo_kinds = [kind for _, _, _, kind in media_records]
+
         # Показуємо діагностичну інформацію
         self._show_diagnostic_info()
 
-        # Даємо час вікну для ініціалізації
-        self.master.after(100, self.load_next_photo)
+        self.load_next_photo()
 
     def _show_diagnostic_info(self):
         """
-        Показує діагностичну інформацію про знайдені файли
+        Показує діагностичну інформацію про знайдені файли.
+        Рядки збираються у список і виводяться одним викликом print.
+        Вміст вихідної теки перелічується лише з --verbose: кількість тек
+        і файлів уже відома з обходу в _get_all_media_files.
         """
-        print(f"Пошук файлів у директорії: {self.source_dir}")
-        print(f"Директорія існує: {os.path.exists(self.source_dir)}")
-        print(f"Це директорія: {os.path.isdir(self.source_dir)}")
-
-        if os.path.exists(self.source_dir):
-            print(f"Вміст директорії:")
+        lines = [
+            f"Пошук файлів у директорії: {self.source_dir}",
+            f"Директорія існує: {os.path.exists(self.source_dir)}",
+            f"Це директорія: {os.path.isdir(self.source_dir)}",
+        ]
+
+        if self.verbose and os.path.exists(self.source_dir):
+            lines.append(f"Вміст директорії (перші {DIAGNOSTIC_LISTING_LIMIT} записів):")
             try:
-                for item in os.listdir(self.source_dir):
-                    item_path = os.path.join(self.source_dir, item)
-                    if os.path.isfile(item_path):
-                        print(f"  ФАЙЛ: {item}")
-                    elif os.path.isdir(item_path):
-                        print(f"  ТЕКА: {item}")
+                with os.scandir(self.source_dir) as entries:
+                    for entry in islice(entries, DIAGNOSTIC_LISTING_LIMIT):
+                        if entry.is_file():
+                            lines.append(f"  ФАЙЛ: {entry.name}")
+                        elif entry.is_dir():
+                            lines.append(f"  ТЕКА: {entry.name}")
             except PermissionError:
-                print("  Помилка доступу до директорії")
+                lines.append("  Помилка доступу до директорії")
 
-        print(f"Знайдено підтримуваних медіафайлів: {len(self.photo_files)}")
-        print(f"Режим сортування: {self.sort_mode_label}")
+        lines.append(f"Знайдено підтримуваних медіафайлів: {len(self.photo_files)}")
+        lines.append(f"Режим сортування: {self.sort_mode_label}")
         if not self.vlc_available:
-            print("Увага: python-vlc не знайдено — відео відображатиметься без відтворення.")
+            lines.append("Увага: python-vlc не знайдено — відео відображатиметься без відтворення.")
         if len(self.photo_files) > 0:
-            print("Перші 5 знайдених файлів:")
-            for i, file in enumerate(list(self.photo_files)[:5]):
-                print(f"  {i+1}. {file}")
+            lines.append("Перші 5 знайдених файлів:")
+            for i, file in enumerate(self.photo_files[:5]):
+                lines.append(f"  {i+1}. {file}")
+        print("\n".join(lines))
 
     def _get_all_media_files(self):
         """
         Рекурсивно збирає всі підтримувані фото та відео з вихідної директорії,
-        включно з підтек, та повертає відсортований список.
-        Після збирання застосовується обраний режим сортування.
+        включно з підтек, та повертає відсортований список записів
+        (шлях, назва, stat або None, тип медіа "Фото"/"Відео").
+        Файли одразу групуються за відносним шляхом теки, після чого
+        застосовується обраний режим сортування.
         """
-        image_extensions = IMAGE_EXTENSIONS
-        video_extensions = VIDEO_EXTENSIONS
         include_photos = self.filetypes in ("all", "photo")
         include_videos = self.filetypes in ("all", "video")
-        all_files = deque() # Використовуємо deque для ефективного додавання/видалення
+        groups = {} # Відносний шлях теки -> записи знайдених у ній файлів
+        source_prefix_len = len(os.path.join(self.source_dir, ""))
+        # stat потрібен лише для сортування за датою чи розміром.
+        needs_stat = SORT_MODE_INFO.get(self.sort_mode, SORT_MODE_INFO["name"]).get("type") == "stat"
+        scanned = 0
+        dirs_scanned = 0
+        found_photos = 0
+        found_videos = 0
+        skipped = 0
 
         active_extensions = ()
         if include_photos:
-            active_extensions += image_extensions
+            active_extensions += IMAGE_EXTENSIONS
         if include_videos:
-            active_extensions += video_extensions
+            active_extensions += VIDEO_EXTENSIONS
 
         print(f"Пошук файлів із розширеннями: {active_extensions if active_extensions else 'немає (фільтр вимкнув усі типи)'}")
 
+        scan = partial(
+            self._scan_directory,
+            include_photos=include_photos,
+            include_videos=include_videos,
+            needs_stat=needs_stat,
+            verbose=self.verbose,
+        )
+        for current_dir, dir_files, dir_videos, dir_skipped, messages in self._walk_media_directories(scan):
+            dirs_scanned += 1
+            if messages:
+                print("\n".join(messages))
+            scanned += len(dir_files) + dir_skipped
+            skipped += dir_skipped
+            found_videos += dir_videos
+            found_photos += len(dir_files) - dir_videos
+            if dir_files:
+                # Для самої вихідної теки зріз дає порожній рядок.
+                groups[current_dir[source_prefix_len:]] = dir_files
+
+        print(
+            f"Проскановано тек: {dirs_scanned}, файлів: {scanned}, "
+            f"знайдено фото: {found_photos}, відео: {found_videos}, пропущено: {skipped}"
+        )
+
+        return self._sort_photo_list(groups)
+
+    def _walk_media_directories(self, scan):
+        """
+        Обходить вихідну теку та її підтеки, викликаючи scan для кожної,
+        і повертає (тека, записи, кількість відео, пропущено, повідомлення).
+        З scan_workers > 1 теки читаються паралельно у пулі потоків: на мережевих
+        дисках кожен os.scandir чекає на сервер, а GIL на цей час звільняється.
+        Порядок тек тут не важливий — групи все одно сортуються згодом.
+        """
+        if self.scan_workers <= 1:
+            # Обхід через os.scandir зі стеком замість os.walk: DirEntry вже знає
+            # тип запису з readdir, тож не потрібен окремий stat() на кожен файл.
+            stack = [self.source_dir]
+            while stack:
+                current_dir = stack.pop()
+                subdirs, *result = scan(current_dir)
+                stack.extend(subdirs)
+                yield (current_dir, *result)
+            return
+
+        with ThreadPoolExecutor(max_workers=self.scan_workers) as pool:
+            pending = {pool.submit(scan, self.source_dir): self.source_dir}
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    current_dir = pending.pop(future)
+                    subdirs, *result = future.result()
+                    for subdir in subdirs:
+                        pending[pool.submit(scan, subdir)] = subdir
+                    yield (current_dir, *result)
+
+    def _scan_directory(self, current_dir, include_photos, include_videos, needs_stat, verbose):
+        """
+        Читає одну теку та повертає (підтеки, записи медіафайлів, кількість відео,
+        кількість пропущених файлів, повідомлення для консолі).
+        Може виконуватися у фоновому потоці, тому нічого не друкує сама.
+        """
+        # Локальні імена замість глобальних у гарячому циклі обходу.
+        image_ext_set = IMAGE_EXT_SET
+        video_ext_set = VIDEO_EXT_SET
+        subdirs = []
+        dir_files = []
+        videos = 0
+        skipped = 0
+        messages = [f"Перевіряю теку: {current_dir}"] if verbose else []
         try:
-            for root, dirs, files in os.walk(self.source_dir):
-                print(f"Перевіряю теку: {root}")
-                for file in files:
-                    file_lower = file.lower()
-                    if include_photos and file_lower.endswith(image_extensions):
-                        full_path = os.path.join(root, file)
-                        all_files.append(full_path)
-                        print(f"  Знайдено фото: {file}")
-                    elif include_videos and file_lower.endswith(video_extensions):
-                        full_path = os.path.join(root, file)
-                        all_files.append(full_path)
-                        print(f"  Знайдено відео: {file}")
+            with os.scandir(current_dir) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        subdirs.append(entry.path)
+                        continue
+                    if not entry.is_file():
+                        continue
+                    # Приводимо до нижнього регістру лише розширення, а не всю назву.
+                    name = entry.name
+                    dot = name.rfind(".")
+                    extension = name[dot:].lower() if dot >= 0 else ""
+                    # Тип визначаємо один раз тут, а не під час кожного показу.
+                    if include_photos and extension in image_ext_set:
+                        media_kind = "Фото"
+                    elif include_videos and extension in video_ext_set:
+                        media_kind = "Відео"
+                        videos += 1
                     else:
-                        print(f"  Пропущено: {file} (не підтримується)")
-        except Exception as e:
-            print(f"Помилка під час пошуку файлів: {e}")
-
-        file_list = list(all_files)
-        return self._sort_photo_list(file_list)
+                        skipped += 1
+                        if verbose:
+                            messages.append(f"  Пропущено: {name} (не підтримується)")
+                        continue
+                    stat_result = None
+                    if needs_stat:
+                        # Беремо stat один раз під час обходу: DirEntry кешує його
+                        # (на Windows він надходить разом із readdir), тож
+                        # сортування вже не звертається до файлової системи.
+                        try:
+                            stat_result = entry.stat()
+                        except OSError:
+                            pass
+                    dir_files.append((entry.path, name, stat_result, media_kind))
+                    if verbose:
+                        messages.append(f"  Знайдено {media_kind.lower()}: {name}")
+        except OSError as e:
+            # Як і os.walk, пропускаємо недоступні теки й продовжуємо пошук.
+            messages.append(f"Помилка під час пошуку файлів у {current_dir}: {e}")
+        return subdirs, dir_files, videos, skipped, messages
 
     def _generate_hotkey(self, index):
         """
@@ -206,20 +414,16 @@ class PhotoSorterApp:
         """
         Повертає назву теки без повного шляху для показу користувачу.
         """
-        cleaned = path.rstrip(os.sep)
+        cleaned = os.path.normpath(path)
         base = os.path.basename(cleaned)
         return base if base else cleaned
 
-    def _is_supported_image(self, path):
-        return path.lower().endswith(IMAGE_EXTENSIONS)
-
-    def _is_supported_video(self, path):
-        return path.lower().endswith(VIDEO_EXTENSIONS)
-
     def _create_placeholder_image(self, title, subtitle=""):
         """
         Створює простий заглушковий кадр із текстом.
         """
+        from PIL import Image, ImageDraw
+
         width, height = 800, 600
         img = Image.new("RGB", (width, height), color=(45, 45, 45))
         draw = ImageDraw.Draw(img)
@@ -234,27 +438,117 @@ class PhotoSorterApp:
         )
         return img
 
-    def _load_image_preview(self, path):
+    def _load_image_preview(self, path, max_width, max_height):
         """
-        Повертає копію зображення або заглушку у випадку помилки.
+        Повертає декодоване зображення або заглушку у випадку помилки.
+        JPEG декодується одразу у зменшеному масштабі (1/2, 1/4 або 1/8),
+        не меншому за область попереднього перегляду.
         """
+        from PIL import Image
+
         try:
             with Image.open(path) as img:
-                return img.copy()
+                if img.format == "JPEG":
+                    img.draft("RGB", (max_width, max_height))
+                # load() читає пікселі до закриття файлу, тож копія не потрібна.
+                img.load()
+            return img
         except Exception as exc:
             print(f"Не вдалося завантажити {path}: {exc}")
             return self._create_placeholder_image("Помилка зображення", os.path.basename(path))
 
-    def _show_pil_image(self, pil_image, max_width, max_height):
+    def _decode_preview(self, path, max_width, max_height):
         """
-        Масштабує та показує PIL.Image у віджеті.
+        Декодує та масштабує фото під область перегляду.
+        Виконується у фоновому потоці, тому не звертається до віджетів Tk.
         """
-        img = pil_image.copy()
+        from PIL import Image
+
+        img = self._load_image_preview(path, max_width, max_height)
         img.thumbnail((max_width, max_height), Image.LANCZOS)
-        self.photo = ImageTk.PhotoImage(img)
+        return img
+
+    def _schedule_prefetch(self, index, max_width, max_height):
+        """
+        Ставить у чергу декодування наступних PREFETCH_AHEAD фото
+        та скасовує застарілі: для вже пройдених індексів або під іншу область.
+        """
+        box = (max_width, max_height)
+        for stale_index in [i for i in self._prefetch if i <= index]:
+            self._prefetch.pop(stale_index)[1].cancel()
+        last_index = min(index + PREFETCH_AHEAD, len(self.photo_files) - 1)
+        for next_index in range(index + 1, last_index + 1):
+            if self.photo_kinds[next_index] == "Відео":
+                continue
+            path = self.photo_files[next_index]
+            cached = self._prefetch.get(next_index)
+            if cached is not None:
+                if cached[0] == box:
+                    continue
+                cached[1].cancel() # Декодування під стару область більше не потрібне
+            future = self._pool.submit(self._decode_preview, path, max_width, max_height)
+            self._prefetch[next_index] = (box, future)
+
+    def _take_prefetched(self, index, max_width, max_height):
+        """
+        Повертає заздалегідь декодоване фото, якщо воно готувалося під область,
+        не меншу за поточну (далі _show_pil_image лише дешево зменшить його).
+        """
+        cached = self._prefetch.pop(index, None)
+        if cached is None:
+            return None
+        (prefetch_width, prefetch_height), future = cached
+        if prefetch_width < max_width or prefetch_height < max_height:
+            future.cancel()
+            return None
+        return future.result()
+
+    def _show_pil_image(self, pil_image, max_width, max_height, fast=False):
+        """
+        Масштабує та показує PIL.Image у віджеті.
+        fast=True використовує дешевший BILINEAR — для проміжних кадрів
+        під час перетягування вікна; остаточний кадр завжди LANCZOS.
+        Вихідне зображення не змінюється (його тримає _current_source для
+        перемальовування), а resize одразу створює зменшену копію без
+        проміжної копії повного розміру, як було б із copy() + thumbnail().
+        """
+        from PIL import Image, ImageTk
+
+        width, height = pil_image.size
+        scale = min(max_width / width, max_height / height)
+        if scale < 1:
+            size = (max(1, round(width * scale)), max(1, round(height * scale)))
+            img = pil_image.resize(size, Image.BILINEAR if fast else Image.LANCZOS, reducing_gap=2.0)
+        else:
+            # Фото вже вміщується (попередньо декодоване під цей розмір або
+            # невелике): resize лише скопіював би його, а PhotoImage і так
+            # переносить пікселі в Tk.
+            img = pil_image
+        photo = ImageTk.PhotoImage(img)
+        self._show_photo_image(photo)
+        return photo
+
+    def _show_photo_image(self, photo):
+        self.photo = photo
         self.image_label.config(image=self.photo, text="")
         self.image_label.image = self.photo
 
+    def _image_cache_key(self, path, max_width, max_height):
+        # Розмір округлюємо до кошиків, щоб дрібні зміни вікна не скидали кеш.
+        return (path, max_width // IMAGE_CACHE_BUCKET_PX, max_height // IMAGE_CACHE_BUCKET_PX)
+
+    def _get_cached_photo(self, key):
+        photo = self._image_cache.get(key)
+        if photo is not None:
+            self._image_cache.move_to_end(key)
+        return photo
+
+    def _cache_photo(self, key, photo):
+        self._image_cache[key] = photo
+        self._image_cache.move_to_end(key)
+        while len(self._image_cache) > IMAGE_CACHE_SIZE:
+            self._image_cache.popitem(last=False)
+
     def _build_instruction_text(self, media_kind):
         base = f"Натисніть {self.destination_instruction_text}, 'S' для пропуску, 'Q' для виходу."
         if media_kind == "Відео":
@@ -269,7 +563,16 @@ class PhotoSorterApp:
         if extra_line:
             parts.append(extra_line)
         parts.append(self.current_instruction_text)
-        self.status_label.config(text="\n".join(parts))
+        self.status_var.set("\n".join(parts))
+
+    def _show_status(self, text):
+        """
+        Показує довільне повідомлення у статус-рядку. Наступний тик
+        _update_video_status має повернути час і підказки, навіть якщо
+        відео на паузі й показані секунди не змінилися.
+        """
+        self._video_status_seconds = None
+        self.status_var.set(text)
 
     def _format_timestamp(self, millis):
         if millis <= 0:
@@ -285,7 +588,7 @@ class PhotoSorterApp:
         if not self.vlc_available:
             return None
         if self.vlc_instance is None:
-            self.vlc_instance = vlc.Instance("--quiet")
+            self.vlc_instance = self.vlc.Instance("--quiet")
         self._stop_video_playback()
         return self.vlc_instance.media_player_new()
 
@@ -321,6 +624,7 @@ class PhotoSorterApp:
         self.vlc_player = player
         self.video_paused = False
         self.video_duration_ms = 0
+        self._video_status_seconds = None
         self._schedule_video_status_update()
         return True
 
@@ -337,9 +641,14 @@ class PhotoSorterApp:
         if total and total > 0:
             self.video_duration_ms = total
         total = self.video_duration_ms
-        progress = f"{self._format_timestamp(current)} / {self._format_timestamp(total)}" if total else ""
-        header = self.current_status_header
-        self._set_status_text(header, progress)
+        # На паузі показані секунди не змінюються (а під час відтворення — на кожному
+        # другому тику): тоді не форматуємо час і не чіпаємо статус-рядок.
+        status_seconds = (current // 1000, total // 1000)
+        if status_seconds != self._video_status_seconds:
+            self._video_status_seconds = status_seconds
+            progress = f"{self._format_timestamp(current)} / {self._format_timestamp(total)}" if total else ""
+            header = self.current_status_header
+            self._set_status_text(header, progress)
         self._schedule_video_status_update()
 
     def _stop_video_playback(self):
@@ -382,7 +691,7 @@ class PhotoSorterApp:
 
         state = player.get_state()
         restart_needed = (
-            length and target < length and state in (vlc.State.Ended, vlc.State.Stopped)
+            length and target < length and state in (self.vlc.State.Ended, self.vlc.State.Stopped)
         )
 
         if restart_needed:
@@ -408,30 +717,25 @@ class PhotoSorterApp:
         reverse = config.get("reverse", False)
         sort_type = config.get("type")
 
-        if sort_type == "alpha":
-            key_func = lambda path: os.path.basename(path).lower()
-        elif sort_type == "natural":
-            key_func = lambda path: self._natural_key(os.path.basename(path))
+        if sort_type == "natural":
+            key_func = _natural_sort_key
         elif sort_type == "stat":
-            attribute = config.get("attribute")
-            key_func = lambda path: self._get_stat_value(path, attribute)
+            key_func = partial(_stat_sort_key, config.get("attribute"))
         else:
-            key_func = lambda path: os.path.basename(path).lower()
+            key_func = _name_sort_key
 
         return key_func, reverse
 
-    def _sort_photo_list(self, files):
+    def _sort_photo_list(self, groups):
         """
-        Групує файли за відносним шляхом теки та сортує кожну групу окремо.
+        Сортує згруповані за відносним шляхом теки файли: спершу теки
+        (вихідна тека першою), потім файли всередині кожної групи.
+        Так читання з диска та створення тек у цілі йдуть тека за текою.
         """
-        if not files:
+        if not groups:
             return []
 
         key_func, reverse = self._get_sort_key()
-        groups = {}
-        for path in files:
-            rel_dir = os.path.dirname(os.path.relpath(path, self.source_dir))
-            groups.setdefault(rel_dir, []).append(path)
 
         def group_key(dir_path):
             normalized = "" if dir_path in ("", ".") else dir_path
@@ -443,101 +747,188 @@ class PhotoSorterApp:
 
         return ordered
 
-    def _natural_key(self, text):
+    def on_resize(self, event):
         """
-        Формує натуральний ключ сортування для тексту.
+        Обробник події зміни розміру вікна.
+        Під час перетягування Tk надсилає <Configure> майже на кожен піксель,
+        тому перезавантаження фото відкладається, доки розмір не усталиться.
         """
-        return [int(chunk) if chunk.isdigit() else chunk.lower() for chunk in NATURAL_CHUNK_RE.split(text)]
+        # Перевіряємо, чи це подія зміни розміру вікна, а не інша подія Configure.
+        if event.widget != self.master:
+            return
+        window_size = (event.width, event.height)
+        if window_size == self._last_window_size:
+            return # Розмір не змінився (переміщення вікна, перебудова дочірніх віджетів)
+        self._last_window_size = window_size
+        if self._resize_after_id is not None:
+            self.master.after_cancel(self._resize_after_id)
+        self._resize_after_id = self.master.after(RESIZE_DEBOUNCE_MS, self._do_resize_reload)
+        # Поки вікно тягнуть, показуємо швидкий BILINEAR-кадр з уже декодованого фото.
+        # after_idle виконується лише між пачками подій, тож кадрів не більше, ніж встигаємо.
+        if self._live_render_job is None:
+            self._live_render_job = self.master.after_idle(self._render_live)
+
+    def _render_live(self):
+        self._live_render_job = None
+        if self._resize_after_id is not None and 0 <= self.current_photo_index < len(self.photo_files):
+            self._render_current(fast=True)
+
+    def _do_resize_reload(self):
+        """
+        Перезавантажує поточне фото, щоб воно адаптувалося до нового розміру вікна.
+        """
+        self._resize_after_id = None
+        if not 0 <= self.current_photo_index < len(self.photo_files):
+            return
+        if self._render_current():
+            # Попередня вибірка готувалася під стару область — перезамовляємо під нову.
+            self._schedule_prefetch(self.current_photo_index, *self._get_preview_box())
+            return
+        # Зменшуємо індекс на 1, щоб load_next_photo завантажила те ж саме фото.
+        self.current_photo_index -= 1
+        self.load_next_photo()
 
-    def _get_stat_value(self, path, attribute):
+    def _render_current(self, fast=False):
         """
-        Безпечно отримує значення st_* для шляху, повертаючи 0 при помилці.
+        Перемальовує поточне фото під новий розмір вікна з кешу або з уже
+        декодованого зображення, не відкриваючи файл повторно.
+        Повертає False, якщо для цього немає придатного зображення.
+        Швидкі (fast) кадри не потрапляють до кешу.
         """
-        try:
-            stat_result = os.stat(path)
-            return getattr(stat_result, attribute, 0)
-        except (FileNotFoundError, PermissionError, OSError):
-            return 0
+        if self.photo_kinds[self.current_photo_index] != "Фото" or self._current_source is None:
+            return False
+        path, img = self._current_source
+        if path != self.photo_files[self.current_photo_index]:
+            return False
+        max_img_width, max_img_height = self._get_preview_box()
+        cache_key = self._image_cache_key(path, max_img_width, max_img_height)
+        photo = self._get_cached_photo(cache_key)
+        if photo is not None:
+            self._show_photo_image(photo)
+            return True
+        # Зображення могло бути декодоване зменшеним (draft або попередня вибірка):
+        # воно придатне, лише якщо не менше за нову область хоча б по одній стороні.
+        if img.width < max_img_width and img.height < max_img_height:
+            return False
+        if fast:
+            self._show_pil_image(img, max_img_width, max_img_height, fast=True)
+        else:
+            self._cache_photo(cache_key, self._show_pil_image(img, max_img_width, max_img_height))
+        return True
 
-    def on_resize(self, event):
+    def _get_preview_box(self):
         """
-        Обробник події зміни розміру вікна.
-        Перезавантажує поточне фото, щоб воно адаптувалося до нового розміру вікна.
+        Повертає максимальні ширину та висоту попереднього перегляду для поточного вікна.
+        Розмір вікна береться з останньої події <Configure> (on_resize); до неї
+        геометрію доводиться перераховувати через update_idletasks.
         """
-        # Перевіряємо, чи це подія зміни розміру вікна, а не інша подія Configure.
-        if event.widget == self.master and hasattr(self, 'current_photo_index'):
-            # Перезавантажуємо поточне фото, щоб воно підлаштувалося під новий розмір.
-            # Зменшуємо індекс на 1, щоб load_next_photo завантажила те ж саме фото.
-            if self.current_photo_index >= 0:
-                self.current_photo_index -= 1
-                self.load_next_photo()
+        if self._last_window_size is not None:
+            window_width, window_height = self._last_window_size
+        else:
+            self.master.update_idletasks()
+            window_width = self.master.winfo_width()
+            window_height = self.master.winfo_height()
+        if window_width <= 1 or window_height <= 1:
+            window_width = 800
+            window_height = 600
+        # Висота статус-рядка залежить від кількості рядків тексту, тому її не кешуємо.
+        status_height = self.status_label.winfo_reqheight()
+        if status_height <= 0:
+            status_height = 60
+        max_img_width = max(100, window_width - 40)  # Відступи, мінімум 100px
+        max_img_height = max(100, window_height - status_height - 40)  # Відступи та висота статус-бару, мінімум 100px
+        if self.verbose:
+            print(f"Розміри вікна: {window_width}x{window_height}, макс. розмір попереднього перегляду: {max_img_width}x{max_img_height}")
+        return max_img_width, max_img_height
 
     def load_next_photo(self):
         """
         Завантажує та відображає наступний медіафайл зі списку.
         Адаптує попередній перегляд до розміру вікна.
+        Файли, які не вдалося показати, пропускаються та запам'ятовуються у self._broken.
         """
+        # Відкладені перемальовування після зміни розміру стосуються попереднього файлу.
+        if self._resize_after_id is not None:
+            self.master.after_cancel(self._resize_after_id)
+            self._resize_after_id = None
+        if self._live_render_job is not None:
+            self.master.after_cancel(self._live_render_job)
+            self._live_render_job = None
         self._stop_video_playback()
         self.current_photo_index += 1
-        if self.current_photo_index < len(self.photo_files):
+        preview_box = None
+        # Пошкоджені файли пропускаємо циклом, а не рекурсією: довга низка битих
+        # файлів не вичерпає стек, а розміри вікна рахуються лише раз.
+        while self.current_photo_index < len(self.photo_files):
             current_file_path = self.photo_files[self.current_photo_index]
-            media_kind = "Відео" if self._is_supported_video(current_file_path) else "Фото"
+            current_basename = self.photo_basenames[self.current_photo_index]
+            media_kind = self.photo_kinds[self.current_photo_index]
             self.current_media_type = media_kind
             self.current_media_path = current_file_path
-            self.current_instruction_text = self._build_instruction_text(media_kind)
-            relative_path = os.path.relpath(current_file_path, self.source_dir)
+            self.current_instruction_text = self.instruction_texts[media_kind]
+            relative_path = self.photo_relpaths[self.current_photo_index]
             self.current_status_header = (
                 f"{media_kind}: {relative_path} "
                 f"({self.current_photo_index + 1}/{len(self.photo_files)})"
             )
             self._set_status_text(self.current_status_header, "" if media_kind == "Фото" else "Завантаження...")
             try:
-                self.master.update_idletasks()
-                window_width = self.master.winfo_width()
-                window_height = self.master.winfo_height()
-                if window_width <= 1 or window_height <= 1:
-                    window_width = 800
-                    window_height = 600
-                status_height = self.status_label.winfo_reqheight() if self.status_label.winfo_reqheight() > 0 else 60
-                max_img_width = max(100, window_width - 40)  # Відступи, мінімум 100px
-                max_img_height = max(100, window_height - status_height - 40)  # Відступи та висота статус-бару, мінімум 100px
-                print(f"Розміри вікна: {window_width}x{window_height}, макс. розмір попереднього перегляду: {max_img_width}x{max_img_height}")
+                if preview_box is None:
+                    preview_box = self._get_preview_box()
+                max_img_width, max_img_height = preview_box
 
                 if media_kind == "Відео" and self.vlc_available:
                     self.image_label.config(image="", text="Завантаження відео...")
                     started = self._play_video(current_file_path)
                     if not started:
-                        placeholder = self._create_placeholder_image("Не вдалося відтворити відео", os.path.basename(current_file_path))
+                        placeholder = self._create_placeholder_image("Не вдалося відтворити відео", current_basename)
                         self._show_pil_image(placeholder, max_img_width, max_img_height)
                         self._set_status_text(self.current_status_header, "Помилка відтворення")
                 else:
                     if media_kind == "Відео" and not self.vlc_available:
-                        img = self._create_placeholder_image("Встановіть python-vlc", os.path.basename(current_file_path))
+                        img = self._create_placeholder_image("Встановіть python-vlc", current_basename)
+                        self._show_pil_image(img, max_img_width, max_img_height)
                     else:
-                        img = self._load_image_preview(current_file_path)
-                    self._show_pil_image(img, max_img_width, max_img_height)
+                        cache_key = self._image_cache_key(current_file_path, max_img_width, max_img_height)
+                        photo = self._get_cached_photo(cache_key)
+                        if photo is not None:
+                            self._show_photo_image(photo)
+                        else:
+                            img = self._take_prefetched(self.current_photo_index, max_img_width, max_img_height)
+                            if img is None:
+                                img = self._load_image_preview(current_file_path, max_img_width, max_img_height)
+                            self._current_source = (current_file_path, img)
+                            self._cache_photo(cache_key, self._show_pil_image(img, max_img_width, max_img_height))
                     self._set_status_text(self.current_status_header)
+                self._schedule_prefetch(self.current_photo_index, max_img_width, max_img_height)
 
                 self.master.focus_force()
+                return
             except Exception as e:
-                self.status_label.config(text=f"Помилка завантаження {os.path.basename(current_file_path)}: {e}\nПропускаю...")
+                self._show_status(f"Помилка завантаження {current_basename}: {e}\nПропускаю...")
                 print(f"Помилка завантаження {current_file_path}: {e}")
-                self.load_next_photo()
+                self._broken.append(current_file_path)
+                self._stop_video_playback()
+                self.current_photo_index += 1
+
+        # Якщо всі фотографії відсортовано або немає фотографій.
+        if len(self.photo_files) == 0:
+            supported_images = ", ".join(IMAGE_EXTENSIONS)
+            supported_videos = ", ".join(VIDEO_EXTENSIONS)
+            self._show_status(
+                "Не знайдено жодного підтримуваного медіафайлу у вказаній директорії!\n"
+                f"Зображення: {supported_images}\n"
+                f"Відео: {supported_videos}"
+            )
+            self.image_label.config(text="Файли не знайдено", image="")
         else:
-            # Якщо всі фотографії відсортовано або немає фотографій.
-            if len(self.photo_files) == 0:
-                supported_images = ", ".join(IMAGE_EXTENSIONS)
-                supported_videos = ", ".join(VIDEO_EXTENSIONS)
-                self.status_label.config(
-                    text=("Не знайдено жодного підтримуваного медіафайлу у вказаній директорії!\n"
-                          f"Зображення: {supported_images}\n"
-                          f"Відео: {supported_videos}")
-                )
-                self.image_label.config(text="Файли не знайдено", image="")
-            else:
-                self.status_label.config(text="Усі медіафайли відсортовано! Завершення.")
-                # Закриваємо вікно через 3 секунди.
-                self.master.after(3000, self.master.destroy)
+            if self._broken:
+                print(f"Не вдалося відкрити файлів: {len(self._broken)}")
+                for path in self._broken:
+                    print(f"  {path}")
+            self._show_status("Усі медіафайли відсортовано! Завершення.")
+            # Закриваємо вікно через 3 секунди.
+            self.master.after(3000, self.close)
 
     def on_key_press(self, event):
         """
@@ -546,23 +937,21 @@ class PhotoSorterApp:
         """
         key = event.char.upper() if event.char else ""
         keysym = event.keysym.upper()
-        if self.current_photo_index >= len(self.photo_files):
-            return # Не обробляти, якщо всі медіафайли відсортовано
+        if not 0 <= self.current_photo_index < len(self.photo_files):
+            return # Не обробляти, поки файли ще не знайдено або коли всі вже відсортовано
 
-        current_file_path = self.photo_files[self.current_photo_index]
         is_video = self.current_media_type == "Відео"
 
         if key in self.key_to_destination:
-            self._move_photo(current_file_path, self.key_to_destination[key])
+            self._move_photo(self.current_photo_index, self.key_to_destination[key])
         elif key == 'S': # Пропустити фотографію
             self._stop_video_playback()
-            self.status_label.config(text=f"Пропущено: {os.path.basename(current_file_path)}")
+            self._show_status(f"Пропущено: {self.photo_basenames[self.current_photo_index]}")
             self.master.update_idletasks() # Оновлюємо інтерфейс, щоб показати статус
             self.load_next_photo()
             return
         elif key == 'Q': # Вихід з програми
-            self._stop_video_playback()
-            self.master.destroy()
+            self.close()
             return
         elif keysym == "SPACE" and is_video:
             self._toggle_video_pause()
@@ -574,23 +963,67 @@ class PhotoSorterApp:
             self._seek_video(VIDEO_SCRUB_STEP_MS)
             return
         else:
-            self.status_label.config(
-                text=f"Невідома клавіша. Використовуйте {self.destination_instruction_text}, 'S' або 'Q'."
+            self._show_status(
+                f"Невідома клавіша. Використовуйте {self.destination_instruction_text}, 'S' або 'Q'."
             )
             return # Не завантажуємо наступне фото, якщо була неправильна клавіша
 
         # Завантажуємо наступне фото після успішної обробки (переміщення або пропуску).
         self.load_next_photo()
 
-    def _move_photo(self, source_path, destination_base_dir):
+    def close(self):
+        """
+        Зупиняє відтворення та фонові задачі і закриває вікно.
+        """
+        self._stop_video_playback()
+        self._pool.shutdown(wait=False, cancel_futures=True)
+        self._prefetch.clear()
+        if self._inflight_copies:
+            self._show_status("Завершую копіювання файлів...")
+            self.master.update_idletasks()
+        self._copy_pool.shutdown(wait=True)
+        self._collect_finished_copies()
+        self.master.destroy()
+
+    def _schedule_copy_poll(self):
+        if self._copy_poll_job is None:
+            self._copy_poll_job = self.master.after(COPY_POLL_MS, self._poll_copies)
+
+    def _poll_copies(self):
+        self._copy_poll_job = None
+        self._collect_finished_copies()
+        if self._inflight_copies:
+            self._schedule_copy_poll()
+
+    def _collect_finished_copies(self):
+        """
+        Повідомляє про завершені фонові копіювання та лишає у списку незавершені.
+        """
+        pending = []
+        for copy_job in self._inflight_copies:
+            future, source_path, destination_path, source_basename = copy_job
+            if not future.done():
+                pending.append(copy_job)
+                continue
+            error = future.exception()
+            if error is None:
+                print(f"Скопійовано: {source_path} -> {destination_path}")
+            else:
+                self._show_status(f"Помилка обробки {source_basename}: {error}")
+                print(f"Помилка обробки {source_path}: {error}")
+        self._inflight_copies = pending
+
+    def _move_photo(self, index, destination_base_dir):
         """
-        Переміщує або копіює медіафайл з 'source_path' до 'destination_base_dir',
+        Переміщує або копіює медіафайл з індексом 'index' до 'destination_base_dir',
         зберігаючи при цьому відносну ієрархію тек.
-        Наприклад, якщо source_dir=/src, source_path=/src/a/b/c.jpg,
+        Наприклад, якщо source_dir=/src, файл=/src/a/b/c.jpg,
         destination_base_dir=/dest, то файл буде переміщено до /dest/a/b/c.jpg.
         """
-        # Обчислюємо відносний шлях файлу відносно вихідної директорії.
-        relative_path = os.path.relpath(source_path, self.source_dir)
+        source_path = self.photo_files[index]
+        source_basename = self.photo_basenames[index]
+        # Відносний шлях файлу обчислено заздалегідь під час пошуку.
+        relative_path = self.photo_relpaths[index]
         # Формуємо повний шлях до цільового файлу.
         destination_path = os.path.join(destination_base_dir, relative_path)
         # Отримуємо шлях до цільової теки для цього файлу.
@@ -598,25 +1031,35 @@ class PhotoSorterApp:
 
         try:
             # Створюємо батьківські теки в цільовій директорії, якщо їх немає.
-            os.makedirs(destination_dir, exist_ok=True)
+            # Вже створені теки запам'ятовуємо, щоб не робити зайвих stat().
+            if destination_dir not in self._mkdir_cache:
+                os.makedirs(destination_dir, exist_ok=True)
+                self._mkdir_cache.add(destination_dir)
+            human_readable_dest = self.destination_labels.get(destination_base_dir, os.path.basename(destination_base_dir))
             # Переміщуємо або копіюємо файл залежно від обраного режиму.
             if self.transfer_mode == "copy":
-                shutil.copy2(source_path, destination_path)
-                action = "Скопійовано"
-            else:
+                # Копія виконується у фоні; результат покаже _poll_copies.
+                future = self._copy_pool.submit(shutil.copy2, source_path, destination_path)
+                self._inflight_copies.append((future, source_path, destination_path, source_basename))
+                self._schedule_copy_poll()
+                self._show_status(f"Копіюється: {source_basename} до {human_readable_dest}")
+                return
+            try:
+                # На тій самій файловій системі це один виклик rename().
+                os.replace(source_path, destination_path)
+            except OSError:
+                # Інший диск (EXDEV) тощо: shutil.move скопіює та видалить оригінал.
                 shutil.move(source_path, destination_path)
-                action = "Переміщено"
-            human_readable_dest = self.destination_labels.get(destination_base_dir, os.path.basename(destination_base_dir))
-            self.status_label.config(text=f"{action}: {os.path.basename(source_path)} до {human_readable_dest}")
-            print(f"{action}: {source_path} -> {destination_path}")
+            self._show_status(f"Переміщено: {source_basename} до {human_readable_dest}")
+            print(f"Переміщено: {source_path} -> {destination_path}")
         except Exception as e:
             # Обробка помилок під час переміщення або копіювання файлу.
-            self.status_label.config(text=f"Помилка обробки {os.path.basename(source_path)}: {e}")
+            self._show_status(f"Помилка обробки {source_basename}: {e}")
             print(f"Помилка обробки {source_path}: {e}")
 
 if __name__ == "__main__":
     def print_usage():
-        print("Використання: python sort-photos.py [--mode move|copy] [--sort <режим>] <вихідна_тека> <тека_1> <тека_2> [тека_3 ...]")
+        print("Використання: python sort-photos.py [--mode move|copy] [--sort <режим>] [--filetypes photo|video|all] [--workers N] [--verbose] <вихідна_тека> <тека_1> <тека_2> [тека_3 ...]")
         print()
         print("Параметри:")
         print("  --mode       Режим роботи: 'move' (переміщення) або 'copy' (копіювання)")
@@ -625,6 +1068,9 @@ if __name__ == "__main__":
         print("               За замовчуванням: name")
         print("  --filetypes  Які типи медіа брати: 'photo', 'video' або 'all'")
         print("               За замовчуванням: all")
+        print("  --workers    Скільки тек читати паралельно під час пошуку (корисно для мережевих дисків)")
+        print("               За замовчуванням: 1")
+        print("  --verbose    Виводити кожну знайдену/пропущену теку й файл під час пошуку")
         print()
         print("Доступні режими сортування (--sort):")
         for key, label, _ in SORT_MODE_VARIANTS:
@@ -657,79 +1103,80 @@ if __name__ == "__main__":
         print("  # Windows приклад")
         print("  python sort-photos.py --mode copy --sort modified C:\\Photos C:\\Photos_Person1 C:\\Photos_Person2")
 
+    def fail(message, show_usage=True):
+        """
+        Друкує повідомлення про помилку (і за потреби довідку) та завершує програму.
+        """
+        print(message)
+        if show_usage:
+            print_usage()
+        sys.exit(1)
+
+    # Опції зі значенням: назва -> (що потрібно вказати після опції, приклад значення).
+    VALUE_OPTIONS = {
+        "--mode": ("'move' або 'copy'", "copy"),
+        "--sort": ("один із документованих режимів", "name"),
+        "--filetypes": ("'photo', 'video' або 'all'", "photo"),
+        "--workers": ("кількість потоків", "8"),
+    }
+
+    def read_option_value(option, i):
+        """
+        Повертає значення опції, заданої як '--опція значення' або '--опція=значення',
+        та індекс наступного аргументу.
+        """
+        if args[i] == option:
+            if i + 1 >= len(args):
+                fail(f"Помилка: після {option} потрібно вказати {VALUE_OPTIONS[option][0]}.")
+            return args[i + 1], i + 2
+        # Форма --опція=значення: префікс уже перевірено, значення береться зрізом.
+        value = args[i][len(option) + 1:]
+        if not value:
+            example = VALUE_OPTIONS[option][1]
+            fail(f"Помилка: використовуйте '{option} {example}' або '{option}={example}'.")
+        return value, i + 1
+
     args = sys.argv[1:]
     mode = "move"
     sort_mode_key = "name"
     filetype_filter = "all"
+    verbose = False
+    scan_workers = 1
     positional_args = []
     i = 0
     while i < len(args):
         arg = args[i]
-        if arg.startswith("--mode"):
-            if arg == "--mode":
-                if i + 1 >= len(args):
-                    print("Помилка: після --mode потрібно вказати 'move' або 'copy'.")
-                    print_usage()
-                    sys.exit(1)
-                mode = args[i + 1].lower()
-                i += 2
-            else:
-                _, _, value = arg.partition("=")
-                if not value:
-                    print("Помилка: використовуйте '--mode copy' або '--mode=copy'.")
-                    print_usage()
-                    sys.exit(1)
+        # Назва опції без '=значення': зріз до '=', без проміжного списку чи кортежу.
+        eq = arg.find("=")
+        option = arg[:eq] if eq > 0 else arg
+        if option in VALUE_OPTIONS:
+            value, i = read_option_value(option, i)
+            if option == "--mode":
                 mode = value.lower()
-                i += 1
-            if mode not in ("move", "copy"):
-                print("Помилка: режим має бути 'move' або 'copy'.")
-                print_usage()
-                sys.exit(1)
-        elif arg.startswith("--sort"):
-            if arg == "--sort":
-                if i + 1 >= len(args):
-                    print("Помилка: після --sort потрібно вказати один із документованих режимів.")
-                    print_usage()
-                    sys.exit(1)
-                sort_value = args[i + 1]
-                i += 2
-            else:
-                _, _, sort_value = arg.partition("=")
-                if not sort_value:
-                    print("Помилка: використовуйте '--sort name' або '--sort=name'.")
-                    print_usage()
-                    sys.exit(1)
-                i += 1
-            normalized = _normalize_sort_mode(sort_value)
-            if normalized not in SORT_MODE_LOOKUP:
-                print(f"Помилка: невідомий режим сортування '{sort_value}'.")
-                print_usage()
-                sys.exit(1)
-            sort_mode_key = SORT_MODE_LOOKUP[normalized]
-        elif arg.startswith("--filetypes"):
-            if arg == "--filetypes":
-                if i + 1 >= len(args):
-                    print("Помилка: після --filetypes потрібно вказати 'photo', 'video' або 'all'.")
-                    print_usage()
-                    sys.exit(1)
-                filetypes_value = args[i + 1]
-                i += 2
-            else:
-                _, _, filetypes_value = arg.partition("=")
-                if not filetypes_value:
-                    print("Помилка: використовуйте '--filetypes photo' або '--filetypes=photo'.")
-                    print_usage()
-                    sys.exit(1)
-                i += 1
-            normalized_ft = filetypes_value.lower()
-            if normalized_ft not in ("photo", "video", "all"):
-                print("Помилка: --filetypes підтримує лише значення 'photo', 'video' або 'all'.")
-                print_usage()
-                sys.exit(1)
-            filetype_filter = normalized_ft
+                if mode not in ("move", "copy"):
+                    fail("Помилка: режим має бути 'move' або 'copy'.")
+            elif option == "--sort":
+                normalized = _normalize_sort_mode(value)
+                if normalized not in SORT_MODE_LOOKUP:
+                    fail(f"Помилка: невідомий режим сортування '{value}'.")
+                sort_mode_key = SORT_MODE_LOOKUP[normalized]
+            elif option == "--filetypes":
+                normalized_ft = value.lower()
+                if normalized_ft not in FILETYPE_CHOICES:
+                    fail("Помилка: --filetypes підтримує лише значення 'photo', 'video' або 'all'.")
+                filetype_filter = normalized_ft
+            elif option == "--workers":
+                if not value.isdecimal() or int(value) < 1:
+                    fail("Помилка: --workers має бути цілим числом не менше 1.")
+                scan_workers = int(value)
+        elif arg == "--verbose":
+            verbose = True
+            i += 1
         elif arg in ("-h", "--help"):
             print_usage()
             sys.exit(0)
+        elif arg.startswith("--"):
+            fail(f"Помилка: невідома опція '{arg}'.")
         else:
             positional_args.append(arg)
             i += 1
@@ -739,25 +1186,27 @@ if __name__ == "__main__":
         sys.exit(1)
 
     # Отримуємо шляхи з аргументів командного рядка.
-    source_directory = positional_args[0]
-    destination_directories = positional_args[1:]
+    source_directory, *destination_directories = positional_args
 
     if len(destination_directories) < 2:
-        print("Помилка: потрібно вказати щонайменше дві цільові теки.")
-        sys.exit(1)
+        fail("Помилка: потрібно вказати щонайменше дві цільові теки.", show_usage=False)
 
-    # Перевіряємо, чи існує вихідна директорія.
-    if not os.path.exists(source_directory):
-        print(f"Помилка: Вихідна директорія '{source_directory}' не існує.")
-        sys.exit(1)
+    # Перевіряємо, чи існує вихідна директорія: один os.stat замість exists + isdir.
+    try:
+        source_stat = os.stat(source_directory)
+    except (FileNotFoundError, NotADirectoryError):
+        fail(f"Помилка: Вихідна директорія '{source_directory}' не існує.", show_usage=False)
+    except OSError as e:
+        fail(f"Помилка: не вдалося перевірити '{source_directory}': {e}", show_usage=False)
 
-    if not os.path.isdir(source_directory):
-        print(f"Помилка: '{source_directory}' не є директорією.")
-        sys.exit(1)
+    if not stat.S_ISDIR(source_stat.st_mode):
+        fail(f"Помилка: '{source_directory}' не є директорією.", show_usage=False)
 
     # Ініціалізуємо головне вікно Tkinter.
+    from tkinter import Tk
+
     root = Tk()
     # Створюємо екземпляр програми.
-    app = PhotoSorterApp(root, source_directory, destination_directories, transfer_mode=mode, sort_mode=sort_mode_key, filetypes=filetype_filter)
+    app = PhotoSorterApp(root, source_directory, destination_directories, transfer_mode=mode, sort_mode=sort_mode_key, filetypes=filetype_filter, verbose=verbose, scan_workers=scan_workers)
     # Запускаємо головний цикл подій Tkinter.
     root.mainloop()